@@ -1,83 +1,271 @@
+import hashlib
+import io
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
+import httpx
 import streamlit as st
-from PIL import Image
-from supabase import create_client, Client
+from PIL import Image, ImageOps
+from supabase import create_client, Client, ClientOptions
 # Removed: import pytesseract 
 
 st.set_page_config(page_title="Recipe Submissions", page_icon="🍽", layout="centered")
 
 # --- Configuration and Setup ---
 
-@st.cache_resource 
-def init_supabase() -> Client:
-    """Initializes and returns the Supabase client using Streamlit secrets."""
+@dataclass(frozen=True, slots=True)
+class _Cfg:
+    """Supabase settings, resolved once from Streamlit secrets."""
+    url: str
+    key: str
+    bucket: str
+    recipes_ttl: int
+
+@st.cache_resource
+def _cfg() -> _Cfg:
+    """Reads and validates the SUPABASE section of Streamlit secrets."""
     if "SUPABASE" not in st.secrets:
         st.error("FATAL ERROR: Missing SUPABASE configuration in .streamlit/secrets.toml. Please check your file.")
         st.stop()
-        
-    url = st.secrets["SUPABASE"].get("URL")
-    key = st.secrets["SUPABASE"].get("KEY")
+
+    secrets = st.secrets["SUPABASE"]
+    url = secrets.get("URL")
+    key = secrets.get("KEY")
     
     if not url or not key:
         st.error("FATAL ERROR: Supabase URL or Key is missing or incomplete in secrets.")
         st.stop()
-        
+
+    # Seconds a page of the recipe list is served from cache; tunable without a deploy
     try:
-        return create_client(url, key)
+        recipes_ttl = int(secrets.get("RECIPES_TTL", 60))
+    except (TypeError, ValueError):
+        recipes_ttl = -1
+    if recipes_ttl < 0:
+        st.error("FATAL ERROR: SUPABASE.RECIPES_TTL in secrets must be a non-negative whole number of seconds.")
+        st.stop()
+
+    return _Cfg(
+        url=url.rstrip("/"),
+        key=key,
+        bucket=secrets.get("BUCKET", "recipes"),
+        recipes_ttl=recipes_ttl,
+    )
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Returns a keep-alive HTTP/2 connection pool for the app's direct Storage REST calls.
+
+    Deliberately separate from the Supabase client, whose postgrest/storage libraries
+    mutate the httpx client they are given (base_url, headers).
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        timeout=30,
+    )
+
+@st.cache_resource 
+def init_supabase() -> Client:
+    """Initializes and returns the Supabase client using Streamlit secrets."""
+    cfg = _cfg()
+
+    # No httpx_client here: supabase-py ignores these timeouts when one is supplied, and
+    # it already keeps its own persistent (keep-alive) clients for the cached Client
+    options = ClientOptions(postgrest_client_timeout=10, storage_client_timeout=30)
+
+    try:
+        return create_client(cfg.url, cfg.key, options=options)
     except Exception as e:
         st.error(f"FATAL ERROR: Failed to create Supabase client. Check network connection or credentials. Details: {e}")
         st.stop()
 
-# Initialize Supabase client globally
+# Initialize configuration and Supabase client globally
+CONFIG: _Cfg = _cfg()
 supabase: Client = init_supabase()
-BUCKET_NAME = st.secrets["SUPABASE"].get("BUCKET", "recipes") 
+
+# Uploaded photos larger than either limit are downscaled to fit the box and re-encoded as JPEG
+MAX_IMAGE_DIMENSION = 1600
+REENCODE_MIN_BYTES = 1_000_000
+JPEG_QUALITY = 85
+
+# Canonical storage extension and content type for the image extensions accepted by the uploader
+_EXT = {"png": "png", "jpg": "jpg", "jpeg": "jpg"}
+_MIME = {"png": "image/png", "jpg": "image/jpeg"}
+
+# Parallel uploads per upload_images() batch; a private pool so a batch can't starve other sessions
+UPLOAD_BATCH_WORKERS = 4
+
+# Shown when a form's token already belongs to a saved row (e.g. an earlier submit timed out after committing)
+ALREADY_SAVED_MSG = (
+    "This recipe was already saved by an earlier submit, so these edits were not applied. "
+    "Submit again to save them as a new recipe."
+)
+
+# Number of recipes shown per page in the 'All recipes' tab
+PAGE_SIZE = 20
 
 # Removed: pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 # Removed: ocr_image function
 
 # --- Supabase Storage Functions ---
 
-def upload_image_to_storage(file) -> str | None:
-    """Upload file bytes to Supabase Storage and return the public URL."""
-    if file is None:
+def sniff_image_ext(head: bytes) -> str | None:
+    """Detects PNG/JPEG from the file's magic bytes rather than trusting its name."""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    return None
+
+
+def needs_reencode(raw: bytes) -> bool:
+    """True if an upload is over REENCODE_MIN_BYTES or larger than MAX_IMAGE_DIMENSION."""
+    if len(raw) > REENCODE_MIN_BYTES:
+        return True
+    # Image.open only parses the header here, so checking the size is cheap
+    with Image.open(io.BytesIO(raw)) as pil_img:
+        return max(pil_img.size) > MAX_IMAGE_DIMENSION
+
+
+def downscale_image(pil_img: Image.Image) -> bytes:
+    """Fits an image into MAX_IMAGE_DIMENSION, rotates it upright and returns it encoded as a JPEG."""
+    # Must run before anything loads the pixels: thumbnail() then lets JPEGs decode at
+    # 1/2-1/8 scale (draft mode) and uses reduce() before the final LANCZOS pass
+    pil_img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+
+    # Re-encoding drops EXIF (orientation included), so bake the rotation into the pixels
+    pil_img = ImageOps.exif_transpose(pil_img)
+
+    # JPEG has no alpha and convert("RGB") turns transparent pixels black, so flatten onto white
+    if pil_img.mode in ("RGBA", "LA") or (pil_img.mode == "P" and "transparency" in pil_img.info):
+        rgba = pil_img.convert("RGBA")
+        flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+        flattened.paste(rgba, mask=rgba.getchannel("A"))
+        pil_img = flattened
+
+    buf = io.BytesIO()
+    pil_img.convert("RGB").save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def public_image_url(path: str) -> str:
+    """Builds the public URL of a Storage object locally (same format supabase-py returns)."""
+    return f"{CONFIG.url}/storage/v1/object/public/{CONFIG.bucket}/{path}"
+
+
+def _is_duplicate_object(response: httpx.Response) -> bool:
+    """True if Storage rejected an upload because the object key already exists."""
+    if response.status_code == 409:
+        return True
+    if response.status_code != 400:
+        return False
+
+    # Older Storage API versions answer 400 with the real status in the JSON body
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and (
+        str(body.get("statusCode")) == "409" or body.get("error") == "Duplicate"
+    )
+
+
+def upload_image_to_storage(raw_bytes: bytes, file_ext: str) -> str | None:
+    """Upload image bytes to Supabase Storage and return the public URL.
+
+    Objects are named by content hash, so re-uploading identical bytes adds nothing to the bucket.
+    Raises instead of reporting through Streamlit so it can run on a worker thread.
+    """
+    if not raw_bytes:
         return None
 
-    # Rewind file pointer after previous reads (PIL)
-    file.seek(0) 
-    file_bytes = file.read()
-    
-    file_ext = file.name.split(".")[-1].lower()
-    if file_ext not in ["png", "jpg", "jpeg"]:
-        file_ext = "jpg" 
+    file_ext = _EXT.get(file_ext.lower(), "jpg")
+    mime = _MIME[file_ext]
 
-    path = f"recipes/{uuid.uuid4()}.{file_ext}"
+    path = f"recipes/{hashlib.sha256(raw_bytes).hexdigest()}.{file_ext}"
+    public_url = public_image_url(path)
 
     try:
-        supabase.storage.from_(BUCKET_NAME).upload(
-            path=path,
-            file=file_bytes,
-            file_options={"content-type": f"image/{file_ext}"},
+        # Raw Storage REST call rather than storage3's upload(): the duplicate check below
+        # needs the HTTP status and error body, and storage3's exception type and payload
+        # differ between releases. That means sending the auth headers ourselves.
+        response = get_http_client().post(
+            f"{CONFIG.url}/storage/v1/object/{CONFIG.bucket}/{path}",
+            content=raw_bytes,
+            headers={
+                "Authorization": f"Bearer {CONFIG.key}",
+                "apikey": CONFIG.key,
+                "Content-Type": mime,
+                # Keys are content hashes, so an object's bytes never change: cache for a year
+                "cache-control": "max-age=31536000",
+            },
+            timeout=30,
         )
-        
-        public_url = supabase.storage.from_(BUCKET_NAME).get_public_url(path)
-        return public_url
-    
+        # An existing key holds the same bytes (same hash), so a duplicate counts as success
+        if not _is_duplicate_object(response):
+            response.raise_for_status()
     except Exception as e:
-        st.error(f"Error uploading image to Supabase Storage. Check Bucket Name/Policies. Details: {e}")
-        return None
+        raise RuntimeError(f"Supabase Storage Upload Error: {e}") from e
+
+    return public_url
+
+
+def _upload_one(image: tuple[bytes, str]) -> tuple[str | None, str | None]:
+    """Uploads one (raw_bytes, file_ext) image and returns (public_url, error) instead of raising."""
+    try:
+        return upload_image_to_storage(*image), None
+    except Exception as e:
+        return None, str(e)
+
+
+def upload_images(images: list[tuple[bytes, str]]) -> list[tuple[str | None, str | None]]:
+    """Uploads several (raw_bytes, file_ext) images in parallel.
+
+    Returns one (public_url, error) pair per image, in input order; error holds the
+    failure details (e.g. a policy or network error) when the upload did not succeed.
+    """
+    with ThreadPoolExecutor(max_workers=UPLOAD_BATCH_WORKERS) as executor:
+        return list(executor.map(_upload_one, images))
 
 
 # --- Supabase DB Functions ---
 
+def save_recipes_to_supabase(rows: list[dict]):
+    """Inserts several recipe rows into the Supabase 'recipes' table in one request.
+
+    Rows carrying a client_token already seen by the table are skipped, so a form
+    that reruns mid-submit cannot create the same recipe twice. Skipped rows are
+    missing from response.data.
+    """
+    if not rows:
+        return None
+
+    if any(row.get("client_token") for row in rows):
+        query = supabase.table("recipes").upsert(
+            rows, on_conflict="client_token", ignore_duplicates=True
+        )
+    else:
+        query = supabase.table("recipes").insert(rows)
+
+    response = query.execute()
+    
+    if response and hasattr(response, "error") and response.error:
+        raise RuntimeError(f"Supabase DB Insert Error: {response.error}")
+        
+    return response
+
+
 def save_recipe_to_supabase(
     name: str,
     description: str | None,
     text_body: str | None,
     image_url: str | None,
+    client_token: str | None = None,
 ):
-    """Inserts recipe data into the Supabase 'recipes' table."""
+    """Inserts a single recipe into the Supabase 'recipes' table."""
     data = {
         "name": name,
         "description": description,
@@ -85,27 +273,112 @@ def save_recipe_to_supabase(
         "image_url": image_url,
     }
 
-    response = supabase.table("recipes").insert(data).execute()
-    
+    if client_token:
+        data["client_token"] = client_token
+
+    return save_recipes_to_supabase([data])
+
+
+@st.cache_data(ttl=CONFIG.recipes_ttl, show_spinner=False)
+def _fetch_recipes(cursor: tuple[str, str] | None, page_size: int):
+    """Cached page query; cleared whenever a new recipe is saved.
+
+    Returns (rows, has_more, total). total is only counted for the first page, since
+    an exact count scans every remaining row.
+    """
+    columns = "id,name,description,created_at"
+    if cursor:
+        query = supabase.table("recipes").select(columns)
+
+        # Keyset pagination: continue strictly after the last (created_at, id) shown.
+        # id breaks ties between rows inserted in the same transaction. The redundant
+        # lte() is what lets the (created_at DESC, id DESC) index bound the scan.
+        created_at, rid = cursor
+        query = query.lte("created_at", created_at).or_(
+            f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt."{rid}")'
+        )
+    else:
+        query = supabase.table("recipes").select(columns, count="exact")
+
+    # One extra row tells us whether a next page exists
+    response = (
+        query
+        .order("created_at", desc=True)
+        .order("id", desc=True)
+        .limit(page_size + 1)
+        .execute()
+    )
+
     if response and hasattr(response, "error") and response.error:
-        raise RuntimeError(f"Supabase DB Insert Error: {response.error}")
-        
-    return response
+        raise RuntimeError(f"Supabase DB Select Error: {response.error}")
+
+    rows = response.data or []
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    # Format dates once per fetch; the cached rows are reused by every rerun until the TTL expires
+    for row in rows:
+        row["created_label"] = _created_label(row.get("created_at"))
+
+    return rows, has_more, response.count if not cursor else None
+
 
+def invalidate_recipe_list() -> None:
+    """Drops cached recipe pages and the remembered total after a new recipe is saved."""
+    _fetch_recipes.clear()
+    st.session_state.pop("recipe_total", None)
 
-def get_recipes_from_supabase():
-    """Fetches all recipes from the Supabase 'recipes' table."""
+
+def get_recipes_from_supabase(cursor: tuple[str, str] | None = None, page_size: int = PAGE_SIZE):
+    """Fetches the page of recipe summaries after cursor, whether more follow, and (first page only) the total."""
+    return _fetch_recipes(cursor, page_size)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_recipe_details_from_supabase(recipe_id) -> dict:
+    """Fetches the heavy fields (text body and image URL) of a single recipe."""
     response = (
         supabase.table("recipes")
-        .select("*")
-        .order("created_at", desc=True)
+        .select("text,image_url")
+        .eq("id", recipe_id)
+        .single()
         .execute()
     )
 
     if response and hasattr(response, "error") and response.error:
         raise RuntimeError(f"Supabase DB Select Error: {response.error}")
 
-    return response.data or []
+    return response.data or {}
+
+
+# --- Formatting Helpers ---
+
+def _fmt_created(ts: str) -> str:
+    """Formats a Supabase ISO timestamp for display."""
+    # fromisoformat accepts a trailing 'Z' natively on Python 3.11+
+    dt_object = datetime.fromisoformat(ts)
+    return dt_object.strftime("%B %d, %Y at %I:%M %p")
+
+
+def _created_label(created_at_raw: str | None) -> str | None:
+    """Returns the 'Submitted ...' caption for a recipe, falling back to the raw value."""
+    if not created_at_raw:
+        return None
+    try:
+        return f"Submitted on: {_fmt_created(created_at_raw)}"
+    except ValueError:
+        return f"Submitted at: {created_at_raw}"
+
+
+def _recipe_summary_md(r: dict) -> str:
+    """Builds the markdown shown at the top of a recipe's expander (description + date)."""
+    parts = []
+    if r.get("description"):
+        parts.append(f"_{r['description']}_")
+
+    if r.get("created_label"):
+        parts.append(f":gray[{r['created_label']}]")
+
+    return "\n\n".join(parts)
 
 
 # --- Streamlit UI ---
@@ -123,22 +396,32 @@ tab_text, tab_image, tab_list = st.tabs(
 with tab_text:
     st.subheader("Submit recipe by text")
 
-    with st.form("text_recipe_form"):
-        name = st.text_input("Recipe name", key="text_name")
-        short_desc = st.text_input("Short description (optional)", key="text_desc")
+    # Success message carried over the rerun that follows a submission
+    if text_flash := st.session_state.pop("text_flash", None):
+        st.success(text_flash)
+
+    # Bumped after a successful save; fresh widget keys give the user an empty form,
+    # while a failed submit keeps everything they typed
+    text_gen = st.session_state.setdefault("text_form_gen", 0)
+
+    with st.form(f"text_recipe_form_{text_gen}"):
+        name = st.text_input("Recipe name", key=f"text_name_{text_gen}")
+        short_desc = st.text_input("Short description (optional)", key=f"text_desc_{text_gen}")
         ingredients = st.text_area(
             "Ingredients",
             placeholder="e.g., 2 eggs, 1 cup flour, 1/2 cup milk...",
             height=120,
-            key="text_ingredients"
+            key=f"text_ingredients_{text_gen}"
         )
         instructions = st.text_area(
             "Instructions",
             placeholder="Step-by-step instructions...",
             height=160,
-            key="text_instructions"
+            key=f"text_instructions_{text_gen}"
         )
 
+        # Idempotency token for this submission; rotated after a successful insert
+        text_token = st.session_state.setdefault("text_submit_token", uuid.uuid4().hex)
         submitted = st.form_submit_button("Submit recipe")
 
     if submitted:
@@ -149,15 +432,25 @@ with tab_text:
         else:
             full_text = f"Ingredients:\n{ingredients}\n\nInstructions:\n{instructions}"
             try:
-                save_recipe_to_supabase(
+                response = save_recipe_to_supabase(
                     name=name,
                     description=short_desc or None,
                     text_body=full_text,
                     image_url=None,
+                    client_token=text_token,
                 )
-                st.success("Text recipe submitted successfully! Check the 'All recipes' tab.")
             except Exception as e:
                 st.error(f"Error saving recipe: {e}")
+            else:
+                # The token now belongs to a committed row either way, so rotate it
+                st.session_state["text_submit_token"] = uuid.uuid4().hex
+                invalidate_recipe_list()
+                if response.data:
+                    st.session_state["text_flash"] = "Text recipe submitted successfully! Check the 'All recipes' tab."
+                    st.session_state["text_form_gen"] = text_gen + 1
+                    st.rerun()
+                else:
+                    st.warning(ALREADY_SAVED_MSG)
 
 # IMAGE SUBMISSION TAB (Simplified without OCR)
 with tab_image:
@@ -166,63 +459,112 @@ with tab_image:
         "Upload a photo of the dish or recipe card. You must manually enter the recipe details."
     )
 
-    with st.form("image_recipe_form"):
-        name_img = st.text_input("Recipe name", key="img_name_required") # Made name required by flow
-        short_desc_img = st.text_input("Short description (optional)", key="img_desc")
+    if img_flash := st.session_state.pop("img_flash", None):
+        st.success(img_flash)
+
+    img_gen = st.session_state.setdefault("img_form_gen", 0)
+
+    with st.form(f"image_recipe_form_{img_gen}"):
+        name_img = st.text_input("Recipe name", key=f"img_name_required_{img_gen}") # Made name required by flow
+        short_desc_img = st.text_input("Short description (optional)", key=f"img_desc_{img_gen}")
         uploaded_img = st.file_uploader(
             "Upload recipe or dish image",
             type=["png", "jpg", "jpeg"],
-            key="img_upload"
+            key=f"img_upload_{img_gen}"
+        )
+        keep_original = st.checkbox(
+            "Keep original image quality",
+            help=f"By default large photos are resized to at most {MAX_IMAGE_DIMENSION}px and saved as JPEG.",
+            key=f"img_keep_original_{img_gen}"
         )
         # Re-purposed the notes field for the main recipe text
         recipe_details = st.text_area(
             "Recipe Details / Ingredients & Instructions",
             placeholder="Enter ingredients, instructions, or notes here...",
             height=250,
-            key="img_recipe_details"
+            key=f"img_recipe_details_{img_gen}"
         )
 
+        img_token = st.session_state.setdefault("img_submit_token", uuid.uuid4().hex)
         submitted_img = st.form_submit_button("Submit image")
 
+    image_saved = False
     if submitted_img:
         if uploaded_img is None or not name_img:
             st.error("Please provide a name and upload an image to submit.")
             st.stop()
+
+        raw = uploaded_img.getvalue()
+        sniffed_ext = sniff_image_ext(raw[:12])
+        if sniffed_ext is None:
+            st.error("Unsupported image format. Please upload a PNG or JPEG file.")
+            st.stop()
             
         try:
-            # 1. Preview image
-            pil_img = Image.open(uploaded_img)
-            st.image(pil_img, caption="Uploaded image", use_container_width=True)
-            
+            # 1. Prepare the upload; PIL only decodes pixels when the image is transformed
+            reencode = not keep_original and needs_reencode(raw)
+            if reencode:
+                upload_bytes, upload_ext = downscale_image(Image.open(io.BytesIO(raw))), "jpg"
+            else:
+                upload_bytes, upload_ext = raw, sniffed_ext
+
             # 2. Upload image to Supabase Storage
-            image_url = upload_image_to_storage(uploaded_img)
+            try:
+                image_url = upload_image_to_storage(upload_bytes, upload_ext)
+            except Exception as e:
+                st.error(f"Error uploading image to Supabase Storage. Check Bucket Name/Policies. Details: {e}")
+                image_url = None
 
             if image_url is None:
                 st.error("Image upload failed. Check Supabase Storage configuration/policies.")
             else:
                 # 3. Save metadata to Supabase DB
-                save_recipe_to_supabase(
+                response = save_recipe_to_supabase(
                     name=name_img,
                     description=short_desc_img or None,
                     text_body=recipe_details or None,
                     image_url=image_url,
+                    client_token=img_token,
                 )
-                st.success("Image recipe submitted successfully! Check the 'All recipes' tab.")
+                st.session_state["img_submit_token"] = uuid.uuid4().hex
+                invalidate_recipe_list()
+                if response.data:
+                    st.session_state["img_flash"] = "Image recipe submitted successfully! Check the 'All recipes' tab."
+                    st.session_state["img_form_gen"] = img_gen + 1
+                    image_saved = True
+                else:
+                    st.warning(ALREADY_SAVED_MSG)
         except Exception as e:
             st.error(f"Fatal error saving image recipe: {e}")
 
+    # Rerun right away so the reset form (and its file) isn't processed again
+    if image_saved:
+        st.rerun()
+
 # LIST TAB
-with tab_list:
+@st.fragment
+def _recipes_fragment():
+    """Renders the recipe list; its own widgets rerun only this fragment."""
     st.subheader("Submitted recipes")
 
+    # Keyset of the last row of each previous page (None for the first page); the
+    # final entry is where the current page starts
+    if "cursors" not in st.session_state:
+        st.session_state.cursors = [None]
+
     recipe_container = st.container()
     
     with st.spinner("Loading recipes..."):
         try:
-            recipes = get_recipes_from_supabase()
+            recipes, has_next, total = get_recipes_from_supabase(st.session_state.cursors[-1])
         except Exception as e:
             st.error(f"Error loading recipes: {e}")
-            recipes = []
+            recipes, has_next, total = [], False, None
+
+    # The total is only counted on the first page; deeper pages reuse it
+    if total is not None:
+        st.session_state.recipe_total = total
+    total = st.session_state.get("recipe_total")
 
     with recipe_container:
         if not recipes:
@@ -231,24 +573,51 @@ with tab_list:
             for r in recipes:
                 title = r.get("name") or "Untitled recipe"
                 with st.expander(title):
-                    if r.get("description"):
-                        st.write(f"_{r['description']}_")
+                    # One markdown element per block keeps the websocket message count low
+                    summary_md = _recipe_summary_md(r)
+                    if summary_md:
+                        st.markdown(summary_md)
 
-                    created_at_raw = r.get("created_at")
-                    if created_at_raw:
+                    # Text and image are only fetched once the user asks for them
+                    if st.toggle("Show full recipe", key=f"show_details_{r['id']}"):
                         try:
-                            # Handle Z timezone
-                            dt_object = datetime.fromisoformat(created_at_raw.replace('Z', '+00:00')) 
-                            formatted_date = dt_object.strftime("%B %d, %Y at %I:%M %p")
-                            st.caption(f"Submitted on: {formatted_date}")
-                        except ValueError:
-                            st.caption(f"Submitted at: {created_at_raw}")
-
-                    if r.get("text"):
-                        st.markdown("**Details / Notes / Recipe Text:**")
-                        st.markdown(r["text"]) 
-
-                    if r.get("image_url"):
-                        st.markdown("**Image:**")
-                        st.markdown(f"[Open image in new tab]({r['image_url']})")
-                        st.image(r["image_url"], use_container_width=True)
\ No newline at end of file
+                            details = get_recipe_details_from_supabase(r["id"])
+                        except Exception as e:
+                            st.error(f"Error loading recipe details: {e}")
+                            details = {}
+
+                        if details.get("text"):
+                            st.markdown("**Details / Notes / Recipe Text:**")
+                            # Plain text: skips the markdown pipeline and keeps the line breaks
+                            st.text(details["text"])
+
+                        if details.get("image_url"):
+                            st.markdown(f"**Image:**\n\n[Open image in new tab]({details['image_url']})")
+                            st.image(details["image_url"], use_container_width=True)
+
+        # Pagination controls
+        page = len(st.session_state.cursors) - 1
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+
+        with col_prev:
+            if st.button("Prev", disabled=page <= 0, key="page_prev"):
+                st.session_state.cursors.pop()
+                st.rerun(scope="fragment")
+
+        with col_info:
+            if total is None:
+                # Unknown until the first page is fetched again (e.g. after a save on a deeper page)
+                st.caption(f"Page {page + 1}")
+            else:
+                total_pages = max(page + 1, -(-total // PAGE_SIZE))
+                st.caption(f"Page {page + 1} of {total_pages} ({total} recipes)")
+
+        with col_next:
+            if st.button("Next", disabled=not has_next, key="page_next"):
+                last = recipes[-1]
+                st.session_state.cursors.append((last["created_at"], str(last["id"])))
+                st.rerun(scope="fragment")
+
+
+with tab_list:
+    _recipes_fragment()
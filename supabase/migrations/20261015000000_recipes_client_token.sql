@@ -0,0 +1,4 @@
+-- Idempotency token sent by the submission forms; duplicate submits are ignored.
+ALTER TABLE recipes ADD COLUMN IF NOT EXISTS client_token text;
+
+CREATE UNIQUE INDEX IF NOT EXISTS recipes_client_token_key ON recipes (client_token);
@@ -0,0 +1,6 @@
+-- Lets the newest-first recipe list (ORDER BY created_at DESC, id DESC) and its keyset
+-- pagination use a bounded index range scan instead of sorting the whole table.
+-- Plain DESC (nulls first) matches the ORDER BY that PostgREST emits for order(desc=True).
+-- Migrations run inside a transaction, so CONCURRENTLY is not used here; on a large live
+-- table, create the index by hand with CREATE INDEX CONCURRENTLY first.
+CREATE INDEX IF NOT EXISTS recipes_created_at_id_desc_idx ON recipes (created_at DESC, id DESC);